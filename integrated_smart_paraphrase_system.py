@@ -13,28 +13,122 @@ Version: 1.0 - Integrated Edition
 """
 
 import os
+import io
+import sys
+import argparse
 import json
 import time
+import heapq
 from datetime import datetime
 from pathlib import Path
-import docx
-from docx.shared import RGBColor
+from functools import cached_property
+from operator import itemgetter
+from collections import Counter
 import shutil
 
-# Import our existing modules
-from plagiarism_detector import PlagiarismDetector
-from ultimate_hybrid_paraphraser import UltimateHybridParaphraser
-from smart_plagiarism_checker import SmartPlagiarismChecker
+# python-docx and the detector modules are imported where they are first needed,
+# so the document picker in main() comes up without loading them
+
+# Fast string similarity for the post-paraphrase check (optional)
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Fast JSON encoder for large reports (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+get_risk_level = itemgetter('combined_risk_level')
+get_online_analysis = itemgetter('online_analysis')
+get_pattern_analysis = itemgetter('pattern_analysis')
+
+# Paraphrasing mode by combined risk score: (min_score, mode, aggressiveness)
+MODE_TABLE = ((90, 'aggressive', 0.9), (75, 'balanced', 0.7), (0, 'smart', 0.6))
+
+
+def _preview(text, limit=100):
+    """Truncate text for report previews"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+def highlight_paragraph(paragraph, color=None):
+    """Set the highlight (default yellow) on every run of a paragraph directly on its w:rPr elements"""
+    if color is None:
+        from docx.enum.text import WD_COLOR_INDEX
+        color = WD_COLOR_INDEX.YELLOW
+    
+    # Skips the per-run Font proxy objects created by run.font.highlight_color
+    for r in paragraph._p.r_lst:
+        r.get_or_add_rPr().highlight_val = color
+
+
+def write_json_report(report_file, data, compact=False, encoded=None):
+    """Write a JSON report atomically, using orjson when available
+    
+    compact=True drops indentation (smaller files, faster encode) for automated runs.
+    encoded maps top-level keys to bytes returned by an earlier call with the same
+    compact setting; those sub-trees are spliced in instead of encoded again.
+    Returns the encoded bytes (None on the json fallback).
+    """
+    tmp_file = f"{report_file}.tmp"
+    buf = None
+    try:
+        if ORJSON_AVAILABLE:
+            # orjson returns UTF-8 bytes: encode once, write once. Datetimes go through
+            # default=str like the json fallback, so the report does not depend on orjson.
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME
+            if not compact:
+                option |= orjson.OPT_INDENT_2
+            if encoded:
+                buf = orjson.dumps({**data, **dict.fromkeys(encoded)}, option=option, default=str)
+                sep = b':' if compact else b': '
+                for key, sub in encoded.items():
+                    if not compact:
+                        # Sub-tree was encoded at the top level; shift it one level in
+                        sub = sub.replace(b'\n', b'\n  ')
+                    marker = orjson.dumps(key) + sep
+                    buf = buf.replace(marker + b'null', marker + sub, 1)
+            else:
+                buf = orjson.dumps(data, option=option, default=str)
+            with open(tmp_file, 'wb', buffering=1 << 20) as f:
+                f.write(buf)
+        else:
+            with open(tmp_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                json.dump(data, f, ensure_ascii=False, indent=None if compact else 2,
+                          separators=(',', ':') if compact else None, default=str)
+        os.replace(tmp_file, report_file)
+    except BaseException:
+        # Don't leave a partial <report>.tmp behind (encode error, full disk, ...)
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+    return buf
+
 
 class IntegratedSmartParaphraseSystem:
+    # Combined risk weights: online detection checks actual sources, patterns are supporting evidence
+    ONLINE_WEIGHT = 0.7
+    PATTERN_WEIGHT = 0.3
+    
     def __init__(self, gemini_api_key=None, mode='smart'):
         print("🚀 Initializing Integrated Smart Paraphrase System...")
         print("🎯 Complete Solution: Detection → Analysis → Paraphrasing → Reporting")
         
         # Initialize components
+        from plagiarism_detector import PlagiarismDetector
+        from smart_plagiarism_checker import SmartPlagiarismChecker
+        
         self.plagiarism_detector = PlagiarismDetector()
         self.pattern_checker = SmartPlagiarismChecker()
-        self.paraphraser = UltimateHybridParaphraser(
+        # Paraphraser loads synonyms + Gemini client, so it is only built on first use
+        self._paraphraser_kwargs = dict(
             synonym_file='sinonim.json',
             gemini_api_key=gemini_api_key,
             mode=mode
@@ -48,10 +142,17 @@ class IntegratedSmartParaphraseSystem:
             'auto_paraphrase_threshold': 70, # Auto paraphrase if similarity >= 70%
             'pattern_risk_threshold': 50,   # Pattern analysis threshold
             'min_paragraph_length': 15,     # Minimum words to process
+            'paraphrase_mode': None,        # Force one paraphraser mode for every paragraph (None = by risk score)
+            'resubmit_aggressive_retry': False, # Retry near-identical results in aggressive mode (extra AI call)
+            'resubmit_text_similarity': 95, # Retry aggressively if paraphrase is this close to the original
             'backup_original': True,        # Create backup before processing
-            'detailed_logging': True        # Enable detailed logs
+            'detailed_logging': True,       # Enable detailed logs
+            'compact_reports': False        # Write JSON reports without indentation
         }
         
+        # Risk ladder for calculate_combined_risk, rebuilt from config for every analysis
+        self._risk_table = self._build_risk_table()
+        
         # Processing statistics
         self.stats = {
             'total_paragraphs': 0,
@@ -69,31 +170,43 @@ class IntegratedSmartParaphraseSystem:
             'paraphrasing_time': 0
         }
         
+        # Timestamp shared by the report files of the current process_document_complete run
+        self._run_ts = None
+        self._paraphrase_encoded = None
+        
         # Results storage
         self.analysis_results = []
         self.paraphrasing_results = []
         
         print("✅ Online plagiarism detector: Ready")
         print("✅ Pattern-based checker: Ready")
-        print("✅ Hybrid paraphraser: Ready")
+        print("✅ Hybrid paraphraser: Loads on first use")
         print(f"✅ Processing mode: {mode.upper()}")
         print("✅ Integrated system ready!")
     
-    def create_backup(self, file_path):
+    @cached_property
+    def paraphraser(self):
+        """Hybrid paraphraser, created on first access"""
+        from ultimate_hybrid_paraphraser import UltimateHybridParaphraser
+        return UltimateHybridParaphraser(**self._paraphraser_kwargs)
+    
+    def create_backup(self, file_path, timestamp=None):
         """Create backup of original document"""
         if not self.config['backup_original']:
             return None
             
         try:
-            backup_dir = Path(file_path).parent / "backups"
+            path = Path(file_path)
+            backup_dir = path.parent / "backups"
             backup_dir.mkdir(exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = Path(file_path).stem
-            extension = Path(file_path).suffix
-            backup_path = backup_dir / f"{filename}_backup_{timestamp}{extension}"
+            timestamp = timestamp or time.strftime("%Y%m%d_%H%M%S")
+            backup_path = backup_dir / f"{path.stem}_backup_{timestamp}{path.suffix}"
             
-            shutil.copy2(file_path, backup_path)
+            # copyfile uses the kernel fast-copy path; only the timestamps are carried over
+            st = os.stat(file_path)
+            shutil.copyfile(file_path, backup_path)
+            os.utime(backup_path, ns=(st.st_atime_ns, st.st_mtime_ns))
             print(f"📋 Backup created: {backup_path}")
             return str(backup_path)
             
@@ -107,19 +220,20 @@ class IntegratedSmartParaphraseSystem:
         print("🔍 COMPREHENSIVE DOCUMENT ANALYSIS")
         print("=" * 80)
         
-        if not os.path.exists(file_path):
+        path = Path(file_path)
+        if not path.is_file():
             print(f"❌ File not found: {file_path}")
             return None
         
         self.stats['processing_start_time'] = datetime.now()
         
-        print(f"📄 Analyzing: {os.path.basename(file_path)}")
+        print(f"📄 Analyzing: {path.name}")
         
         # Step 1: Online plagiarism detection
         print(f"\n🌐 STEP 1: Online Plagiarism Detection")
         online_start = time.time()
         
-        online_results = self.plagiarism_detector.scan_document_for_plagiarism(file_path)
+        online_results = self.plagiarism_detector.scan_document_for_plagiarism(str(path))
         
         online_end = time.time()
         self.stats['online_detection_time'] = online_end - online_start
@@ -132,7 +246,7 @@ class IntegratedSmartParaphraseSystem:
         print(f"\n🔍 STEP 2: Pattern-Based Risk Analysis")
         pattern_start = time.time()
         
-        pattern_results = self.pattern_checker.scan_document(file_path)
+        pattern_results = self.pattern_checker.scan_document(str(path))
         
         pattern_end = time.time()
         self.stats['pattern_analysis_time'] = pattern_end - pattern_start
@@ -154,8 +268,20 @@ class IntegratedSmartParaphraseSystem:
         print(f"\n✅ Comprehensive analysis completed!")
         return combined_results
     
+    def _build_risk_table(self):
+        """Risk ladder from the current config: (min_score, risk_level, recommendation, priority), highest first"""
+        return sorted([
+            (self.config['high_risk_threshold'], 'very_high', 'immediate_paraphrase', 'critical'),
+            (self.config['medium_risk_threshold'], 'high', 'paraphrase_required', 'high'),
+            (self.config['low_risk_threshold'], 'medium', 'paraphrase_recommended', 'medium'),
+            (float('-inf'), 'low', 'monitor_only', 'low')
+        ], reverse=True)
+    
     def combine_analysis_results(self, online_results, pattern_results):
         """Combine online and pattern analysis results"""
+        # Pick up threshold changes made to self.config since the last analysis
+        self._risk_table = self._build_risk_table()
+        
         combined = {
             'filename': online_results['filename'],
             'analysis_timestamp': datetime.now().isoformat(),
@@ -169,6 +295,9 @@ class IntegratedSmartParaphraseSystem:
             'priority_actions': []
         }
         
+        # Paragraph counts per combined risk level, tallied while combining
+        risk_counts = {'very_high': 0, 'high': 0, 'medium': 0, 'low': 0}
+        
         # Create comprehensive paragraph analysis
         for i in range(online_results['total_paragraphs']):
             para_analysis = {
@@ -209,9 +338,12 @@ class IntegratedSmartParaphraseSystem:
             # Calculate combined risk
             combined_risk = self.calculate_combined_risk(para_analysis)
             para_analysis.update(combined_risk)
+            risk_counts[combined_risk['combined_risk_level']] += 1
             
             combined['paragraph_analysis'].append(para_analysis)
         
+        combined['risk_counts'] = risk_counts
+        
         # Generate recommendations
         combined['recommendations'] = self.generate_recommendations(combined)
         
@@ -233,25 +365,12 @@ class IntegratedSmartParaphraseSystem:
         # Combined scoring algorithm
         # Online detection is weighted more heavily (70%) as it checks actual sources
         # Pattern analysis provides supporting evidence (30%)
-        combined_score = (online_score * 0.7) + (pattern_score * 0.3)
+        combined_score = (online_score * self.ONLINE_WEIGHT) + (pattern_score * self.PATTERN_WEIGHT)
         
         # Determine risk level and recommendation
-        if combined_score >= self.config['high_risk_threshold']:
-            risk_level = 'very_high'
-            recommendation = 'immediate_paraphrase'
-            priority = 'critical'
-        elif combined_score >= self.config['medium_risk_threshold']:
-            risk_level = 'high'
-            recommendation = 'paraphrase_required' 
-            priority = 'high'
-        elif combined_score >= self.config['low_risk_threshold']:
-            risk_level = 'medium'
-            recommendation = 'paraphrase_recommended'
-            priority = 'medium'
-        else:
-            risk_level = 'low'
-            recommendation = 'monitor_only'
-            priority = 'low'
+        for threshold, risk_level, recommendation, priority in self._risk_table:
+            if combined_score >= threshold:
+                break
         
         return {
             'combined_risk_level': risk_level,
@@ -266,13 +385,8 @@ class IntegratedSmartParaphraseSystem:
         """Generate actionable recommendations based on combined analysis"""
         recommendations = []
         
-        # Count paragraphs by risk level
-        risk_counts = {'very_high': 0, 'high': 0, 'medium': 0, 'low': 0}
-        
-        for para in combined_results['paragraph_analysis']:
-            risk_level = para['combined_risk_level']
-            if risk_level in risk_counts:
-                risk_counts[risk_level] += 1
+        # Paragraph counts by risk level (tallied in combine_analysis_results)
+        risk_counts = combined_results['risk_counts']
         
         # Generate specific recommendations
         if risk_counts['very_high'] > 0:
@@ -323,105 +437,156 @@ class IntegratedSmartParaphraseSystem:
         
         return recommendations
     
-    def auto_paraphrase_document(self, file_path, combined_analysis):
+    def auto_paraphrase_document(self, file_path, combined_analysis, timestamp=None):
         """Automatically paraphrase high-risk paragraphs"""
         print("\n" + "=" * 80)
         print("🤖 AUTO-PARAPHRASING HIGH-RISK CONTENT")
         print("=" * 80)
         
-        if not os.path.exists(file_path):
+        path = Path(file_path)
+        if not path.is_file():
             print(f"❌ File not found: {file_path}")
             return None
         
         paraphrase_start = time.time()
         
         try:
-            doc = docx.Document(file_path)
+            import docx
+            doc = docx.Document(str(path))
+            
+            # Materialize paragraphs and their text once - python-docx rebuilds both on every access
+            paragraphs = list(doc.paragraphs)
+            total = len(paragraphs)
+            texts = [p.text.strip() for p in paragraphs]
+            min_length = self.config['min_paragraph_length']
+            eligible = [len(text.split()) >= min_length for text in texts]
             
             paraphrase_results = {
-                'filename': os.path.basename(file_path),
+                'filename': path.name,
                 'paraphrase_timestamp': datetime.now().isoformat(),
-                'total_paragraphs': len(doc.paragraphs),
+                'total_paragraphs': total,
                 'paragraphs_processed': 0,
                 'paragraphs_paraphrased': 0,
                 'skipped_paragraphs': 0,
+                'skipped_noop': 0,
                 'paraphrase_details': [],
                 'summary': {}
             }
             
             processed_count = 0
             paraphrased_count = 0
+            noop_count = 0
+            
+            # Thresholds read from config once per document (changes apply to the next run)
+            auto_threshold = self.config['auto_paraphrase_threshold']
+            # The retry costs a Gemini call, and the check is only cheap with rapidfuzz
+            forced_mode = self.config['paraphrase_mode']
+            retry_similarity = (self.config['resubmit_text_similarity']
+                                if self.config['resubmit_aggressive_retry'] and RAPIDFUZZ_AVAILABLE and not forced_mode
+                                else None)
+            # Scores below both thresholds can never qualify for paraphrasing
+            skip_below = min(self.config['low_risk_threshold'], auto_threshold)
+            
+            print(f"📄 Processing: {total} paragraphs")
             
-            print(f"📄 Processing: {len(doc.paragraphs)} paragraphs")
+            # Cheap "skipped" lines are buffered; the buffer is flushed before each
+            # paraphraser call (which prints its own output) and after its result
+            log_buf = []
+            log = log_buf.append if self.config['detailed_logging'] else (lambda line: None)
+            
+            def flush_log():
+                if log_buf:
+                    sys.stdout.write("\n".join(log_buf) + "\n")
+                    sys.stdout.flush()
+                    log_buf.clear()
             
             for para_analysis in combined_analysis['paragraph_analysis']:
                 para_index = para_analysis['paragraph_index'] - 1  # 0-based for docx
                 
-                if para_index >= len(doc.paragraphs):
+                if para_index >= total:
                     continue
                 
-                paragraph = doc.paragraphs[para_index]
-                para_text = paragraph.text.strip()
-                
                 # Skip empty or very short paragraphs
-                if not para_text or len(para_text.split()) < self.config['min_paragraph_length']:
+                if not eligible[para_index]:
                     continue
                 
+                paragraph = paragraphs[para_index]
+                para_text = texts[para_index]
+                
                 processed_count += 1
                 
+                combined_score = para_analysis['combined_risk_score']
+                if combined_score < skip_below:
+                    continue
+                
                 # Determine if paraphrasing is needed
                 should_paraphrase = False
                 reason = ""
                 
-                combined_score = para_analysis['combined_risk_score']
                 recommendation = para_analysis['recommendation']
                 
                 if recommendation in ['immediate_paraphrase', 'paraphrase_required']:
                     should_paraphrase = True
                     reason = f"High risk (score: {combined_score:.1f})"
-                elif recommendation == 'paraphrase_recommended' and combined_score >= self.config['auto_paraphrase_threshold']:
+                elif recommendation == 'paraphrase_recommended' and combined_score >= auto_threshold:
                     should_paraphrase = True
                     reason = f"Above auto-paraphrase threshold ({combined_score:.1f})"
                 
-                print(f"\n📄 Paragraph {para_analysis['paragraph_index']}: ", end="")
+                para_label = f"\n📄 Paragraph {para_analysis['paragraph_index']}: "
                 
                 if should_paraphrase:
-                    print(f"🤖 Paraphrasing ({reason})")
+                    log(f"{para_label}🤖 Paraphrasing ({reason})")
+                    flush_log()
                     
                     # Choose paraphrasing mode based on risk level
-                    if combined_score >= 90:
-                        self.paraphraser.switch_mode('aggressive')
-                        aggressiveness = 0.9
-                    elif combined_score >= 75:
-                        self.paraphraser.switch_mode('balanced')
-                        aggressiveness = 0.7
-                    else:
-                        self.paraphraser.switch_mode('smart')
-                        aggressiveness = 0.6
+                    mode, aggressiveness = next(
+                        (mode, aggr) for min_score, mode, aggr in MODE_TABLE if combined_score >= min_score
+                    )
+                    mode = forced_mode or mode
                     
-                    # Paraphrase the paragraph
+                    # Paraphrase the paragraph (mode is per call, the paraphraser's own mode is untouched)
                     paraphrase_result = self.paraphraser.process_paragraph_ultimate(
                         para_text,
                         paragraph_index=para_analysis['paragraph_index'],
-                        total_paragraphs=len(doc.paragraphs),
-                        aggressiveness=aggressiveness
+                        total_paragraphs=total,
+                        aggressiveness=aggressiveness,
+                        mode=mode
                     )
                     
-                    if paraphrase_result and paraphrase_result['paraphrase']:
+                    # Opt-in local verification instead of a new online scan: a near-identical result gets one aggressive retry
+                    if (retry_similarity is not None and paraphrase_result and paraphrase_result['paraphrase'] and
+                            mode != 'aggressive' and
+                            fuzz.ratio(para_text, paraphrase_result['paraphrase']) >= retry_similarity):
+                        log(f"   🔁 Result too close to original - retrying in aggressive mode")
+                        flush_log()
+                        paraphrase_result = self.paraphraser.process_paragraph_ultimate(
+                            para_text,
+                            paragraph_index=para_analysis['paragraph_index'],
+                            total_paragraphs=total,
+                            aggressiveness=0.9,
+                            mode='aggressive'
+                        ) or paraphrase_result
+                    
+                    if not paraphrase_result or not paraphrase_result['paraphrase']:
+                        log(f"   ❌ Failed to paraphrase")
+                    elif paraphrase_result['paraphrase'] == para_text or paraphrase_result['similarity'] >= combined_score:
+                        # Unchanged or not an improvement - leave the paragraph XML alone
+                        noop_count += 1
+                        log(f"   ⏭️ No improvement ({paraphrase_result['similarity']:.1f}%) - original kept")
+                    else:
                         # Replace paragraph text
                         paragraph.text = paraphrase_result['paraphrase']
                         
                         # Highlight the changed paragraph (optional)
-                        for run in paragraph.runs:
-                            run.font.highlight_color = WD_COLOR_INDEX.YELLOW
+                        highlight_paragraph(paragraph)
                         
                         paraphrased_count += 1
                         
                         # Store paraphrasing details
                         paraphrase_details = {
                             'paragraph_index': para_analysis['paragraph_index'],
-                            'original_text': para_text[:100] + '...' if len(para_text) > 100 else para_text,
-                            'paraphrased_text': paraphrase_result['paraphrase'][:100] + '...' if len(paraphrase_result['paraphrase']) > 100 else paraphrase_result['paraphrase'],
+                            'original_text': _preview(para_text),
+                            'paraphrased_text': _preview(paraphrase_result['paraphrase']),
                             'original_similarity': combined_score,
                             'new_similarity': paraphrase_result['similarity'],
                             'improvement': combined_score - paraphrase_result['similarity'],
@@ -431,20 +596,21 @@ class IntegratedSmartParaphraseSystem:
                         
                         paraphrase_results['paraphrase_details'].append(paraphrase_details)
                         
-                        print(f"   ✅ Success: {combined_score:.1f}% → {paraphrase_result['similarity']:.1f}% (-{paraphrase_details['improvement']:.1f}%)")
-                        
-                    else:
-                        print(f"   ❌ Failed to paraphrase")
+                        log(f"   ✅ Success: {combined_score:.1f}% → {paraphrase_result['similarity']:.1f}% (-{paraphrase_details['improvement']:.1f}%)")
+                    flush_log()
                 else:
-                    print(f"✅ Skipped ({combined_score:.1f}% - acceptable)")
+                    log(f"{para_label}✅ Skipped ({combined_score:.1f}% - acceptable)")
+            
+            flush_log()
             
             # Update results
             paraphrase_results['paragraphs_processed'] = processed_count
             paraphrase_results['paragraphs_paraphrased'] = paraphrased_count
             paraphrase_results['skipped_paragraphs'] = processed_count - paraphrased_count
+            paraphrase_results['skipped_noop'] = noop_count
             
             # Save the modified document
-            output_info = self.save_paraphrased_document(doc, file_path)
+            output_info = self.save_paraphrased_document(doc, path, timestamp)
             if output_info:
                 paraphrase_results['output_files'] = output_info
                 paraphrase_results['output_file'] = output_info['paraphrased_file']  # Backward compatibility
@@ -466,7 +632,7 @@ class IntegratedSmartParaphraseSystem:
             print(f"❌ Error during auto-paraphrasing: {e}")
             return None
     
-    def save_paraphrased_document(self, doc, original_path):
+    def save_paraphrased_document(self, doc, original_path, timestamp=None):
         """Save the paraphrased document in 'completed' folder"""
         try:
             path_obj = Path(original_path)
@@ -475,16 +641,20 @@ class IntegratedSmartParaphraseSystem:
             completed_dir = Path("completed")
             completed_dir.mkdir(exist_ok=True)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = timestamp or time.strftime("%Y%m%d_%H%M%S")
             output_filename = f"{path_obj.stem}_paraphrased_{timestamp}{path_obj.suffix}"
             output_path = completed_dir / output_filename
             
-            # Save paraphrased document
-            doc.save(str(output_path))
+            # Save paraphrased document: build the package in memory, then one write + atomic rename
+            buffer = io.BytesIO()
+            doc.save(buffer)
+            tmp_path = output_path.with_suffix('.tmp')
+            tmp_path.write_bytes(buffer.getvalue())
+            os.replace(tmp_path, output_path)
             
             # Also copy original document to completed folder for comparison
             original_copy = completed_dir / f"{path_obj.stem}_ORIGINAL_{timestamp}{path_obj.suffix}"
-            shutil.copy2(original_path, str(original_copy))
+            shutil.copyfile(original_path, original_copy)
             
             print(f"\n💾 COMPLETED DOCUMENTS:")
             print(f"   📄 Original: {original_copy}")
@@ -494,7 +664,9 @@ class IntegratedSmartParaphraseSystem:
             return {
                 'paraphrased_file': str(output_path),
                 'original_copy': str(original_copy),
-                'completed_folder': str(completed_dir)
+                'completed_folder': str(completed_dir),
+                'paraphrased_name': output_filename,
+                'original_name': original_copy.name
             }
             
         except Exception as e:
@@ -512,19 +684,31 @@ class IntegratedSmartParaphraseSystem:
         print(f"🔍 Processed: {results['paragraphs_processed']}")
         print(f"🤖 Paraphrased: {results['paragraphs_paraphrased']}")
         print(f"⏭️  Skipped: {results['skipped_paragraphs']}")
+        if results.get('skipped_noop'):
+            print(f"♻️  Unchanged (no improvement): {results['skipped_noop']}")
         
         if results['paragraphs_paraphrased'] > 0:
             print(f"\n🎯 PARAPHRASING RESULTS:")
             
-            total_improvement = sum(detail['improvement'] for detail in results['paraphrase_details'] if detail['improvement'] > 0)
+            # Single pass: cumulative improvement + bounded heap of the top 5
+            total_improvement = 0.0
+            top = []
+            for i, detail in enumerate(results['paraphrase_details']):
+                improvement = detail['improvement']
+                if improvement > 0:
+                    total_improvement += improvement
+                entry = (improvement, -i, detail)  # -i keeps earlier paragraphs first on ties
+                if len(top) < 5:
+                    heapq.heappush(top, entry)
+                else:
+                    heapq.heappushpop(top, entry)
             avg_improvement = total_improvement / results['paragraphs_paraphrased']
             
             print(f"   📈 Average improvement: {avg_improvement:.1f}% similarity reduction")
             print(f"   🎉 Total improvement: {total_improvement:.1f}% cumulative reduction")
             
             print(f"\n🔝 TOP IMPROVEMENTS:")
-            sorted_details = sorted(results['paraphrase_details'], key=lambda x: x['improvement'], reverse=True)
-            for detail in sorted_details[:5]:
+            for _, _, detail in sorted(top, reverse=True):
                 print(f"   Para {detail['paragraph_index']}: {detail['original_similarity']:.1f}% → {detail['new_similarity']:.1f}% (-{detail['improvement']:.1f}%)")
         
         print("=" * 80)
@@ -534,36 +718,48 @@ class IntegratedSmartParaphraseSystem:
         print("🚀 STARTING COMPLETE DOCUMENT PROCESSING")
         print("🎯 Workflow: Backup → Analysis → Paraphrasing → Reporting")
         
-        # Step 1: Create backup
-        backup_path = self.create_backup(file_path)
-        
-        # Step 2: Comprehensive analysis
-        combined_analysis = self.analyze_document_comprehensive(file_path)
-        
-        if not combined_analysis:
-            print("❌ Analysis failed - stopping process")
+        path = Path(file_path)
+        if not path.is_file():
+            print(f"❌ File not found: {file_path}")
             return None
         
-        # Step 3: Auto-paraphrasing (if enabled)
-        paraphrase_results = None
-        if auto_paraphrase:
-            paraphrase_results = self.auto_paraphrase_document(file_path, combined_analysis)
-        
-        # Step 4: Final report
-        final_report = self.generate_final_report(combined_analysis, paraphrase_results, backup_path)
-        
-        # Step 5: Update final statistics
-        self.stats['processing_end_time'] = datetime.now()
-        self.stats['total_processing_time'] = (
-            self.stats['processing_end_time'] - self.stats['processing_start_time']
-        ).total_seconds()
-        
-        # Print final summary
-        self.print_final_summary(final_report)
-        
-        return final_report
+        # One timestamp for every file produced by this run; cleared afterwards so
+        # direct save_* / analysis calls get their own
+        timestamp = self._run_ts = time.strftime("%Y%m%d_%H%M%S")
+        try:
+            # Step 1: Create backup
+            backup_path = self.create_backup(path, timestamp)
+            
+            # Step 2: Comprehensive analysis
+            combined_analysis = self.analyze_document_comprehensive(path)
+            
+            if not combined_analysis:
+                print("❌ Analysis failed - stopping process")
+                return None
+            
+            # Step 3: Auto-paraphrasing (if enabled)
+            paraphrase_results = None
+            if auto_paraphrase:
+                paraphrase_results = self.auto_paraphrase_document(path, combined_analysis, timestamp)
+            
+            # Step 4: Final report
+            final_report = self.generate_final_report(combined_analysis, paraphrase_results, backup_path, timestamp)
+            
+            # Step 5: Update final statistics
+            self.stats['processing_end_time'] = datetime.now()
+            self.stats['total_processing_time'] = (
+                self.stats['processing_end_time'] - self.stats['processing_start_time']
+            ).total_seconds()
+            
+            # Print final summary
+            self.print_final_summary(final_report)
+            
+            return final_report
+        finally:
+            self._run_ts = None
+            self._paraphrase_encoded = None
     
-    def generate_final_report(self, analysis_results, paraphrase_results, backup_path):
+    def generate_final_report(self, analysis_results, paraphrase_results, backup_path, timestamp=None):
         """Generate comprehensive final report"""
         report = {
             'document_info': {
@@ -594,12 +790,19 @@ class IntegratedSmartParaphraseSystem:
                     report['next_steps'].append("🤖 Use ultimate_hybrid_paraphraser.py for specific paragraphs")
         
         # Save comprehensive report
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = timestamp or time.strftime("%Y%m%d_%H%M%S")
         report_file = f"integrated_analysis_report_{timestamp}.json"
         
+        # Reuse the paraphrase report bytes when they were encoded for this same dict;
+        # taken once, so stale bytes are never spliced into a later report
+        compact = self.config['compact_reports']
+        encoded = None
+        cached, self._paraphrase_encoded = self._paraphrase_encoded, None
+        if cached and paraphrase_results is cached[0] and compact == cached[1]:
+            encoded = {'paraphrase_results': cached[2]}
+        
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+            write_json_report(report_file, report, compact, encoded)
             
             report['report_file'] = report_file
             print(f"\n📋 Comprehensive report saved: {report_file}")
@@ -618,7 +821,7 @@ class IntegratedSmartParaphraseSystem:
         # Document info
         print(f"📄 Document: {final_report['document_info']['filename']}")
         if final_report['document_info']['backup_path']:
-            print(f"📋 Backup: {os.path.basename(final_report['document_info']['backup_path'])}")
+            print(f"📋 Backup: {Path(final_report['document_info']['backup_path']).name}")
         
         # Processing statistics
         stats = final_report['processing_statistics']
@@ -645,8 +848,8 @@ class IntegratedSmartParaphraseSystem:
             if paraphrase.get('output_files'):
                 output_files = paraphrase['output_files']
                 print(f"   📁 Results in completed/ folder:")
-                print(f"      📄 Original: {os.path.basename(output_files['original_copy'])}")
-                print(f"      🤖 Paraphrased: {os.path.basename(output_files['paraphrased_file'])}")
+                print(f"      📄 Original: {output_files['original_name']}")
+                print(f"      🤖 Paraphrased: {output_files['paraphrased_name']}")
             elif paraphrase.get('output_file'):
                 print(f"   💾 Output file: {os.path.basename(paraphrase['output_file'])}")
         
@@ -671,30 +874,25 @@ class IntegratedSmartParaphraseSystem:
         """Update analysis statistics"""
         self.stats['total_paragraphs'] = combined_results['total_paragraphs']
         
-        for para in combined_results['paragraph_analysis']:
-            risk_level = para['combined_risk_level']
-            
-            if para['online_analysis']:
-                self.stats['online_checked_paragraphs'] += 1
-            
-            if para['pattern_analysis']:
-                self.stats['pattern_checked_paragraphs'] += 1
-            
-            if risk_level == 'very_high':
-                self.stats['high_risk_found'] += 1
-            elif risk_level == 'high':
-                self.stats['medium_risk_found'] += 1
-            elif risk_level == 'medium':
-                self.stats['low_risk_found'] += 1
+        paragraphs = combined_results['paragraph_analysis']
+        self.stats['online_checked_paragraphs'] += sum(map(bool, map(get_online_analysis, paragraphs)))
+        self.stats['pattern_checked_paragraphs'] += sum(map(bool, map(get_pattern_analysis, paragraphs)))
+        
+        risk_levels = Counter(map(get_risk_level, paragraphs))
+        self.stats['high_risk_found'] += risk_levels['very_high']
+        self.stats['medium_risk_found'] += risk_levels['high']
+        self.stats['low_risk_found'] += risk_levels['medium']
     
-    def save_combined_analysis(self, combined_results):
+    def save_combined_analysis(self, combined_results, compact=None):
         """Save combined analysis results"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if compact is None:
+            compact = self.config['compact_reports']
+        
+        timestamp = self._run_ts or time.strftime("%Y%m%d_%H%M%S")
         report_file = f"combined_analysis_{timestamp}.json"
         
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(combined_results, f, ensure_ascii=False, indent=2, default=str)
+            write_json_report(report_file, combined_results, compact)
             
             print(f"📋 Combined analysis saved: {report_file}")
             return report_file
@@ -703,14 +901,18 @@ class IntegratedSmartParaphraseSystem:
             print(f"⚠️ Could not save combined analysis: {e}")
             return None
     
-    def save_paraphrase_report(self, paraphrase_results):
+    def save_paraphrase_report(self, paraphrase_results, compact=None):
         """Save paraphrasing report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        if compact is None:
+            compact = self.config['compact_reports']
+        
+        timestamp = self._run_ts or time.strftime("%Y%m%d_%H%M%S")
         report_file = f"paraphrase_report_{timestamp}.json"
         
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(paraphrase_results, f, ensure_ascii=False, indent=2, default=str)
+            buf = write_json_report(report_file, paraphrase_results, compact)
+            # The final report embeds the same dict, so keep its encoding around
+            self._paraphrase_encoded = (paraphrase_results, compact, buf) if buf else None
             
             print(f"📋 Paraphrasing report saved: {report_file}")
             return report_file
@@ -720,31 +922,54 @@ class IntegratedSmartParaphraseSystem:
             return None
 
 
+# Directory names never searched for documents
+_SKIP_DIRS = frozenset({'backup', 'backups', '__pycache__', '.git', 'venv', '.venv', 'node_modules',
+                        '.mypy_cache', '.pytest_cache'})
+
+
+def _scan_docx(root):
+    """Yield (path, stat_result) for .docx files under root, skipping backup/tool directories"""
+    subdirs = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.name.endswith('.docx') and not entry.name.startswith('~'):
+                # DirEntry.stat() is cached, so the menu never stats the file again
+                yield entry.path, entry.stat()
+    
+    for subdir in subdirs:
+        yield from _scan_docx(subdir)
+
+
 def find_docx_files():
-    """Find all .docx files in the project directory with priority order"""
-    docx_files = []
+    """Find all .docx files in the project directory with priority order
+    
+    Returns a list of (path, stat_result) tuples.
+    """
+    # Common case: documents/ already has files - no need to walk the whole project
+    if os.path.isdir('./documents'):
+        with os.scandir('./documents') as entries:
+            docx_files = [
+                (entry.path, entry.stat()) for entry in entries
+                if entry.name.endswith('.docx') and not entry.name.startswith('~') and entry.is_file()
+            ]
+        if docx_files:
+            return docx_files
     
-    # Priority order: documents/ folder first, then others
-    priority_folders = ['./documents', '.']
-    other_files = []
+    priority = []
+    other = []
     
     # Search in current directory and subdirectories
-    for root, dirs, files in os.walk('.'):
-        # Skip backup and temporary directories
-        if any(skip in root for skip in ['backup', '__pycache__', '.git', 'venv']):
-            continue
-            
-        for file in files:
-            if file.endswith('.docx') and not file.startswith('~'):
-                full_path = os.path.join(root, file)
-                
-                # Prioritize files from documents/ folder
-                if root == './documents':
-                    docx_files.insert(0, full_path)  # Add to beginning
-                else:
-                    docx_files.append(full_path)  # Add to end
+    for full_path, st in _scan_docx('.'):
+        # Prioritize files from documents/ folder
+        if os.path.dirname(full_path) == './documents':
+            priority.append((full_path, st))
+        else:
+            other.append((full_path, st))
     
-    return docx_files
+    return priority + other
 
 def select_document(auto_select=False):
     """Let user select document to process"""
@@ -760,17 +985,18 @@ def select_document(auto_select=False):
     print(f"📄 Found {len(docx_files)} document(s):")
     print("-" * 50)
     
-    for i, file_path in enumerate(docx_files, 1):
-        file_size = os.path.getsize(file_path) / 1024  # KB
-        mod_time = datetime.fromtimestamp(os.path.getmtime(file_path)).strftime("%Y-%m-%d %H:%M")
-        print(f"  {i}. {os.path.basename(file_path)}")
-        print(f"     📂 {os.path.dirname(file_path)}")
+    for i, (file_path, st) in enumerate(docx_files, 1):
+        file_size = st.st_size / 1024  # KB
+        mod_time = time.strftime("%Y-%m-%d %H:%M", time.localtime(st.st_mtime))
+        parent, name = os.path.split(file_path)
+        print(f"  {i}. {name}")
+        print(f"     📂 {parent}")
         print(f"     📏 {file_size:.1f} KB | 🕒 {mod_time}")
         print()
     
     # Auto-select first document if in auto mode or non-interactive
     if auto_select or len(docx_files) == 1:
-        selected_file = docx_files[0]
+        selected_file = docx_files[0][0]
         print(f"✅ Auto-selected: {os.path.basename(selected_file)}")
         return selected_file
     
@@ -781,7 +1007,7 @@ def select_document(auto_select=False):
             index = int(choice) - 1
             
             if 0 <= index < len(docx_files):
-                selected_file = docx_files[index]
+                selected_file = docx_files[index][0]
                 print(f"✅ Selected: {os.path.basename(selected_file)}")
                 return selected_file
             else:
@@ -789,18 +1015,31 @@ def select_document(auto_select=False):
                 
         except (ValueError, EOFError):
             # Fallback to auto-select if input fails
-            selected_file = docx_files[0]
+            selected_file = docx_files[0][0]
             print(f"✅ Auto-selected (input unavailable): {os.path.basename(selected_file)}")
             return selected_file
 
-def main():
+def parse_args(argv=None):
+    """Command-line options for non-interactive runs"""
+    parser = argparse.ArgumentParser(description="Integrated smart paraphrase system")
+    parser.add_argument('--document', metavar='PATH', help="Document to process (skips document selection)")
+    parser.add_argument('--mode', choices=['smart', 'balanced', 'aggressive', 'turnitin_safe'],
+                        help="Paraphraser mode for every paragraph (default: chosen per paragraph by risk score)")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--analysis-only', action='store_true', help="Analyze without auto-paraphrasing")
+    group.add_argument('--auto', action='store_true', help="Run complete processing without prompting")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main function for integrated smart paraphrase system"""
+    args = parse_args(argv)
+    
     print("🚀 INTEGRATED SMART PARAPHRASE SYSTEM")
     print("🎯 Complete Solution: Detection → Analysis → Paraphrasing → Reporting")
     print("=" * 80)
     
     # Let user select document to process (with auto-fallback)
-    document_path = select_document(auto_select=True)
+    document_path = args.document or select_document(auto_select=True)
     
     if not document_path:
         return
@@ -808,24 +1047,30 @@ def main():
     # Initialize integrated system
     print("\n🔧 Initializing integrated system...")
     
-    # You can change the mode here: 'smart', 'balanced', 'aggressive', 'turnitin_safe'
-    system = IntegratedSmartParaphraseSystem(mode='smart')
+    # Modes: 'smart', 'balanced', 'aggressive', 'turnitin_safe' (--mode)
+    system = IntegratedSmartParaphraseSystem(mode=args.mode or 'smart')
+    system.config['paraphrase_mode'] = args.mode
     
     # Process document completely
     print(f"\n🎯 Processing document: {os.path.basename(document_path)}")
     
-    # Auto-processing options (with fallback for non-interactive mode)
-    try:
-        print(f"\n🤔 Processing options:")
-        print(f"   1. Analysis only (no auto-paraphrasing)")
-        print(f"   2. Complete processing (analysis + auto-paraphrasing)")
-        
-        choice = input("Choose option (1/2) [default: 2]: ").strip() or '2'
-        auto_paraphrase = choice == '2'
-    except EOFError:
-        # Auto-fallback for non-interactive environments
-        print("🤖 Auto-mode: Running complete processing (analysis + auto-paraphrasing)")
-        auto_paraphrase = True
+    # Auto-processing options (from flags, else prompt with fallback for non-interactive mode)
+    if args.analysis_only or args.auto:
+        auto_paraphrase = args.auto
+        system.config['compact_reports'] = True
+    else:
+        try:
+            print(f"\n🤔 Processing options:")
+            print(f"   1. Analysis only (no auto-paraphrasing)")
+            print(f"   2. Complete processing (analysis + auto-paraphrasing)")
+            
+            choice = input("Choose option (1/2) [default: 2]: ").strip() or '2'
+            auto_paraphrase = choice == '2'
+        except EOFError:
+            # Auto-fallback for non-interactive environments
+            print("🤖 Auto-mode: Running complete processing (analysis + auto-paraphrasing)")
+            auto_paraphrase = True
+            system.config['compact_reports'] = True
     
     # Start processing
     final_report = system.process_document_complete(document_path, auto_paraphrase=auto_paraphrase)
@@ -840,8 +1085,8 @@ def main():
             if 'output_files' in final_report['paraphrase_results']:
                 output_files = final_report['paraphrase_results']['output_files']
                 print(f"📁 Check 'completed/' folder for:")
-                print(f"   📄 Original: {os.path.basename(output_files['original_copy'])}")
-                print(f"   🤖 Paraphrased: {os.path.basename(output_files['paraphrased_file'])}")
+                print(f"   📄 Original: {output_files['original_name']}")
+                print(f"   🤖 Paraphrased: {output_files['paraphrased_name']}")
             elif 'output_file' in final_report['paraphrase_results']:
                 print(f"💾 Output file: {os.path.basename(final_report['paraphrase_results']['output_file'])}")
         
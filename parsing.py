@@ -1,13 +1,19 @@
 import re
 import random
+import bisect
 import os
 import json
 import unicodedata
 from typing import Dict, List, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import shutil
+import io
+import contextlib
 
 # Import untuk Word processing (install dengan: pip install python-docx)
 try:
@@ -19,9 +25,46 @@ except ImportError:
     DOCX_AVAILABLE = False
     print("⚠️ python-docx not installed. Install with: pip install python-docx")
 
+# Optional: one-pass multi-pattern scan for semantic patterns (pip install pyahocorasick)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Fast JSON encoder for reports (optional)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Word tokenizer for the similarity estimate
+_WORD_RE = re.compile(r'\w+')
+
+
+# Status labels by similarity reduction: [0, 30), [30, 50), [50, 70), [70, ...)
+_STATUS_THRESHOLDS = (30, 50, 70)
+_STATUS_LABELS = (
+    "❌ LOW - May need more aggressive settings",
+    "⚠️ MODERATE - Decent evasion rate",
+    "✅ GOOD - High evasion rate",
+    "✅ EXCELLENT - Very high evasion rate",
+)
+
+
+def _wordset(text):
+    """Set of lowercase word tokens in text"""
+    # One C-level lower() + findall beats lowercasing each match from finditer
+    return set(_WORD_RE.findall(text.lower()))
+
 class UltimatePlagiarismEvasion:
-    def __init__(self):
-        print("🎯 Initializing Ultimate Plagiarism Evasion System...")
+    def __init__(self, verbose=False, seed=None):
+        if verbose:
+            print("🎯 Initializing Ultimate Plagiarism Evasion System...")
+        
+        # Private RNG: no shared module lock, and reproducible with a seed
+        self._rng = random.Random(seed)
         
         # Zero-width invisible characters (tidak terlihat mata)
         self.invisible_chars = [
@@ -182,6 +225,34 @@ class UltimatePlagiarismEvasion:
             }
         ]
         
+        # Compile once: these run for every paragraph of every document
+        for structure in self.structure_patterns:
+            structure['compiled'] = re.compile(structure['pattern'], re.IGNORECASE)
+        
+        # Flat, immutable (pattern, regex, replacements, category) table in priority order
+        self._semantic_compiled = tuple(
+            (pattern, re.compile(re.escape(pattern), re.IGNORECASE), tuple(replacements), category)
+            for category, patterns in self.semantic_transformations.items()
+            for pattern, replacements in patterns.items()
+        )
+        
+        # Aho-Corasick automaton finds every semantic pattern in one pass over the text
+        self._semantic_ac = None
+        if AHOCORASICK_AVAILABLE:
+            self._semantic_ac = ahocorasick.Automaton()
+            for pattern, _, _, _ in self._semantic_compiled:
+                self._semantic_ac.add_word(pattern.lower(), pattern)
+            self._semantic_ac.make_automaton()
+        else:
+            # Fallback single pass: a lookahead alternation reports a match at every
+            # position, so overlapping patterns are all seen (longest first, in case
+            # one pattern is a prefix of another at the same position)
+            lowered = {pattern.lower(): pattern for pattern, _, _, _ in self._semantic_compiled}
+            self._semantic_union = re.compile(
+                '(?=(' + '|'.join(re.escape(p) for p in sorted(lowered, key=len, reverse=True)) + '))'
+            )
+            self._semantic_by_lower = lowered
+        
         # Advanced word-level transformations
         self.word_transformations = {
             'academic_verbs': {
@@ -209,6 +280,13 @@ class UltimatePlagiarismEvasion:
             }
         }
         
+        # Flat word -> (alternatives, category) index: one lookup per word
+        self._word_index = {}
+        for category, word_dict in self.word_transformations.items():
+            for word, alternatives in word_dict.items():
+                self._word_index.setdefault(word, (alternatives, category))
+        self._punct_re = re.compile(r'[^\w]')
+        
         # Priority sections for document processing
         self.priority_sections = {
             'HIGH': [
@@ -225,63 +303,101 @@ class UltimatePlagiarismEvasion:
             ]
         }
         
+        # One compiled keyword alternation per priority level (plain substring match)
+        self._priority_res = {
+            level: re.compile('|'.join(re.escape(k) for k in self.priority_sections[level]))
+            for level in ('HIGH', 'MEDIUM')
+        }
+        
         # Minimum paragraph length for processing (words)
         self.min_paragraph_length = 20
         
-        print("✅ Ultimate evasion system loaded!")
-        print(f"🔧 Semantic patterns: {sum(len(v) for v in self.semantic_transformations.values())}")
-        print(f"🔧 Structure patterns: {len(self.structure_patterns)}")
-        print(f"🔧 Word transformations: {sum(len(v) for v in self.word_transformations.values())}")
+        # LRU of ultimate_transform results for repeated paragraphs (boilerplate, headers)
+        self._transform_cache = OrderedDict()
+        self.transform_cache_size = 1024
+        
+        # Tables/figures/numbers, then reference-list markers
+        self._skip_paragraph_re = re.compile(
+            r'\d+\.\d+|\btabel\b|\bgambar\b|\bfigure\b|\btable\b'
+            r'|\(\d{4}\)|\bet al\b|\bvol\b|\bno\b'
+        )
+        
+        if verbose:
+            print("✅ Ultimate evasion system loaded!")
+            print(f"🔧 Semantic patterns: {sum(len(v) for v in self.semantic_transformations.values())}")
+            print(f"🔧 Structure patterns: {len(self.structure_patterns)}")
+            print(f"🔧 Word transformations: {sum(len(v) for v in self.word_transformations.values())}")
     
     def insert_invisible_watermark(self, text: str, density: float = 0.15) -> str:
         """Insert invisible characters strategically"""
         words = text.split()
-        result = []
+        if len(words) < 2:
+            return ''.join(words)
+        
+        # One draw per word gap; bind the RNG methods outside the loop
+        rand = self._rng.random
+        choice = self._rng.choice
+        invisible_chars = self.invisible_chars
+        result = [words[0]]
         
-        for i, word in enumerate(words):
+        for word in words[1:]:
+            # Insert invisible char after the previous word, then a normal space
+            if rand() < density:
+                result.append(choice(invisible_chars))
+            result.append(' ')
             result.append(word)
-            
-            # Insert invisible char after word (except last word)
-            if i < len(words) - 1:
-                if random.random() < density:
-                    invisible_char = random.choice(self.invisible_chars)
-                    result.append(invisible_char)
-            
-            # Add normal space (except after last word)
-            if i < len(words) - 1:
-                result.append(' ')
         
         return ''.join(result)
     
+    def _semantic_hits(self, text: str) -> set:
+        """Semantic patterns present in text (one Aho-Corasick pass when available)"""
+        lowered = text.lower()
+        if self._semantic_ac:
+            return {pattern for _, pattern in self._semantic_ac.iter(lowered)}
+        return {self._semantic_by_lower[found] for found in self._semantic_union.findall(lowered)}
+    
     def apply_semantic_transformations(self, text: str) -> tuple:
         """Apply contextual semantic transformations"""
-        transformed_text = text
         changes_made = []
+        spans = []
+        hits = self._semantic_hits(text)
         
         # Apply all semantic transformation categories
-        for category, patterns in self.semantic_transformations.items():
-            for pattern, replacements in patterns.items():
-                if pattern.lower() in transformed_text.lower():
-                    replacement = random.choice(replacements)
+        for pattern, pattern_regex, replacements, category in self._semantic_compiled:
+            if pattern in hits:
+                # First occurrence not already claimed by an earlier pattern
+                match = next((m for m in pattern_regex.finditer(text)
+                              if all(m.end() <= start or m.start() >= end for start, end, _ in spans)), None)
+                
+                if match:
+                    replacement = self._rng.choice(replacements)
                     
-                    # Case-insensitive replacement while preserving case
-                    pattern_regex = re.compile(re.escape(pattern), re.IGNORECASE)
-                    match = pattern_regex.search(transformed_text)
+                    # Preserve capitalization of first word
+                    if match.group()[0].isupper():
+                        replacement = replacement.capitalize()
                     
-                    if match:
-                        # Preserve capitalization of first word
-                        if match.group()[0].isupper():
-                            replacement = replacement.capitalize()
-                        
-                        transformed_text = pattern_regex.sub(replacement, transformed_text, count=1)
-                        changes_made.append({
-                            'type': 'semantic_transformation',
-                            'original': pattern,
-                            'replacement': replacement,
-                            'category': category
-                        })
+                    spans.append((match.start(), match.end(), replacement))
+                    changes_made.append({
+                        'type': 'semantic_transformation',
+                        'original': pattern,
+                        'replacement': replacement,
+                        'category': category
+                    })
         
-        return transformed_text, changes_made
+        if not spans:
+            return text, changes_made
+        
+        # Rebuild the text once instead of re-substituting into a growing string
+        spans.sort()
+        parts = []
+        pos = 0
+        for start, end, replacement in spans:
+            parts.append(text[pos:start])
+            parts.append(replacement)
+            pos = end
+        parts.append(text[pos:])
+        
+        return ''.join(parts), changes_made
     
     def apply_structural_reordering(self, text: str) -> tuple:
         """Apply structural sentence reordering"""
@@ -290,11 +406,11 @@ class UltimatePlagiarismEvasion:
         
         for structure in self.structure_patterns:
             pattern = structure['pattern']
-            replacement = structure['replacement']
+            compiled = structure['compiled']
             
-            if re.search(pattern, transformed_text, re.IGNORECASE):
+            if compiled.search(transformed_text):
                 old_text = transformed_text
-                transformed_text = re.sub(pattern, replacement, transformed_text, flags=re.IGNORECASE)
+                transformed_text = compiled.sub(structure['replacement'], transformed_text)
                 
                 if old_text != transformed_text:
                     changes_made.append({
@@ -311,42 +427,48 @@ class UltimatePlagiarismEvasion:
         transformed_words = []
         changes_made = []
         
+        # The RNG is only consulted for indexed words; bind it outside the loop
+        rand = self._rng.random
+        choice = self._rng.choice
+        word_index = self._word_index
+        
         for word in words:
             # Clean word for matching (remove punctuation)
-            clean_word = re.sub(r'[^\w]', '', word.lower())
-            transformed = False
-            
-            # Check all transformation categories
-            for category, word_dict in self.word_transformations.items():
-                if clean_word in word_dict and random.random() < transformation_rate:
-                    alternatives = word_dict[clean_word]
-                    replacement = random.choice(alternatives)
-                    
-                    # Preserve capitalization and punctuation
-                    if word[0].isupper():
-                        replacement = replacement.capitalize()
-                    
-                    # Add back punctuation
-                    punctuation = ''.join(c for c in word if not c.isalnum())
-                    final_word = replacement + punctuation
-                    
-                    transformed_words.append(final_word)
-                    changes_made.append({
-                        'type': 'word_transformation',
-                        'original': word,
-                        'replacement': final_word,
-                        'category': category
-                    })
-                    transformed = True
-                    break
+            clean_word = word.lower() if word.isalnum() else self._punct_re.sub('', word.lower())
             
-            if not transformed:
+            entry = word_index.get(clean_word)
+            if entry and rand() < transformation_rate:
+                alternatives, category = entry
+                replacement = choice(alternatives)
+                
+                # Preserve capitalization and punctuation
+                if word[0].isupper():
+                    replacement = replacement.capitalize()
+                
+                # Add back punctuation (most words have none)
+                if word.isalnum():
+                    final_word = replacement
+                else:
+                    final_word = replacement + ''.join(c for c in word if not c.isalnum())
+                
+                transformed_words.append(final_word)
+                changes_made.append({
+                    'type': 'word_transformation',
+                    'original': word,
+                    'replacement': final_word,
+                    'category': category
+                })
+            else:
                 transformed_words.append(word)
         
         return ' '.join(transformed_words), changes_made
     
-    def ultimate_transform(self, text: str, aggressiveness: float = 0.7) -> dict:
-        """Apply the ultimate transformation combining all techniques"""
+    def ultimate_transform(self, text: str, aggressiveness: float = 0.7, record_changes: bool = True) -> dict:
+        """Apply the ultimate transformation combining all techniques
+        
+        record_changes=False leaves 'changes_made' empty (total_changes is still set),
+        keeping results small for batch callers that only need the counts.
+        """
         if not text or not text.strip():
             return {
                 'original': text,
@@ -357,6 +479,12 @@ class UltimatePlagiarismEvasion:
             }
         
         original_text = text.strip()
+        cache_key = (original_text, round(aggressiveness, 2), record_changes)
+        cached = self._transform_cache.get(cache_key)
+        if cached is not None:
+            self._transform_cache.move_to_end(cache_key)
+            return self._copy_cached_result(cached)
+        
         current_text = original_text
         all_changes = []
         
@@ -365,9 +493,11 @@ class UltimatePlagiarismEvasion:
         all_changes.extend(semantic_changes)
         
         # Step 2: Structural reordering (medium impact)
+        had_structural = False
         if aggressiveness > 0.3:
             current_text, structure_changes = self.apply_structural_reordering(current_text)
             all_changes.extend(structure_changes)
+            had_structural = bool(structure_changes)
         
         # Step 3: Word-level transformations (controlled by aggressiveness)
         word_rate = min(aggressiveness * 0.6, 0.5)  # Max 50% word transformation
@@ -379,60 +509,82 @@ class UltimatePlagiarismEvasion:
         current_text = self.insert_invisible_watermark(current_text, watermark_density)
         
         # Calculate similarity reduction estimate
-        original_words = set(re.findall(r'\w+', original_text.lower()))
-        transformed_words = set(re.findall(r'\w+', current_text.lower()))
+        original_words = _wordset(original_text)
         
         if len(original_words) > 0:
-            word_overlap = len(original_words.intersection(transformed_words)) / len(original_words)
+            # intersection() probes the token list directly; no second set is built
+            transformed_tokens = _WORD_RE.findall(current_text.lower())
+            word_overlap = len(original_words.intersection(transformed_tokens)) / len(original_words)
             estimated_similarity = word_overlap * 100
         else:
             estimated_similarity = 100
         
         # Adjust similarity based on structural changes
-        if any(change['type'] == 'structural_reordering' for change in all_changes):
+        if had_structural:
             estimated_similarity *= 0.7  # 30% additional reduction for structure changes
         
         similarity_reduction = 100 - estimated_similarity
         
-        # Determine status
-        if similarity_reduction >= 70:
-            status = "✅ EXCELLENT - Very high evasion rate"
-        elif similarity_reduction >= 50:
-            status = "✅ GOOD - High evasion rate"
-        elif similarity_reduction >= 30:
-            status = "⚠️ MODERATE - Decent evasion rate"
-        else:
-            status = "❌ LOW - May need more aggressive settings"
+        # Determine status (bisect_right: a value on a threshold takes the higher band)
+        status = _STATUS_LABELS[bisect.bisect_right(_STATUS_THRESHOLDS, similarity_reduction)]
         
-        return {
+        result = {
             'original': original_text,
             'transformed': current_text,
             'similarity_reduction': round(similarity_reduction, 1),
-            'changes_made': all_changes,
+            'changes_made': all_changes if record_changes else [],
             'total_changes': len(all_changes),
             'status': status,
             'aggressiveness_used': aggressiveness,
             'has_invisible_watermark': True,
             'word_count_original': len(original_text.split()),
-            'word_count_transformed': len(current_text.split())
+            # The watermark step rejoins words with single spaces, so spaces + 1 is exact
+            'word_count_transformed': current_text.count(' ') + 1
         }
+        
+        # Cache a snapshot: changes_made as a tuple, so nothing a caller does to
+        # the returned result can reach the cached entry
+        self._transform_cache[cache_key] = dict(result, changes_made=tuple(result['changes_made']))
+        if len(self._transform_cache) > self.transform_cache_size:
+            self._transform_cache.popitem(last=False)
+        
+        return self._copy_cached_result(self._transform_cache[cache_key])
+    
+    @staticmethod
+    def _copy_cached_result(cached):
+        """Fresh result dict from a cache snapshot (new changes_made list and change dicts)"""
+        return dict(cached, changes_made=[dict(change) for change in cached['changes_made']])
     
     def get_section_priority(self, text):
         """Determine priority level of a section based on content"""
         text_lower = text.lower()
         
         # Check for high priority keywords
-        for keyword in self.priority_sections['HIGH']:
-            if keyword in text_lower:
-                return 'HIGH'
+        if self._priority_res['HIGH'].search(text_lower):
+            return 'HIGH'
         
         # Check for medium priority keywords
-        for keyword in self.priority_sections['MEDIUM']:
-            if keyword in text_lower:
-                return 'MEDIUM'
+        if self._priority_res['MEDIUM'].search(text_lower):
+            return 'MEDIUM'
         
         return 'LOW'
     
+    def has_transformable_content(self, text):
+        """Whether any semantic, structural or word transformation can apply to text
+        
+        When none can, ultimate_transform only adds invisible watermark characters,
+        which leaves the word set (and so the similarity reduction) unchanged.
+        """
+        if self._semantic_hits(text):
+            return True
+        if any(structure['compiled'].search(text) for structure in self.structure_patterns):
+            return True
+        word_index = self._word_index
+        return any(
+            (word if word.isalnum() else self._punct_re.sub('', word)) in word_index
+            for word in text.lower().split()
+        )
+    
     def is_paragraph_suitable_for_processing(self, paragraph_text):
         """Check if paragraph should be processed"""
         # Skip empty or very short paragraphs
@@ -440,12 +592,9 @@ class UltimatePlagiarismEvasion:
         if word_count < self.min_paragraph_length:
             return False
         
-        # Skip paragraphs that are mostly numbers/tables
-        if re.search(r'\d+\.\d+|\btabel\b|\bgambar\b|\bfigure\b|\btable\b', paragraph_text.lower()):
-            return False
-        
-        # Skip reference lists
-        if re.search(r'\(\d{4}\)|\bet al\b|\bvol\b|\bno\b', paragraph_text.lower()):
+        # Skip paragraphs that are mostly numbers/tables, and reference lists
+        # (one lowercase copy, one scan)
+        if self._skip_paragraph_re.search(paragraph_text.lower()):
             return False
         
         # Skip headers/titles (all caps or very short)
@@ -475,12 +624,52 @@ class UltimatePlagiarismEvasion:
         return False
 
 
+def list_docx_files(folder):
+    """Names of the Word documents in folder (skips Office ~$ lock files)"""
+    # scandir's DirEntry answers is_file() from the directory read, no extra stat
+    with os.scandir(folder) as entries:
+        return [entry.name for entry in entries
+                if entry.name.endswith('.docx') and not entry.name.startswith('~') and entry.is_file()]
+
+
+def write_json_report(report_file, data):
+    """Write an indented JSON report atomically (tmp file + os.replace), using orjson when available
+    
+    Both encoders give the same output: unknown values, datetimes included, go through str().
+    """
+    tmp_file = f"{report_file}.tmp"
+    try:
+        if ORJSON_AVAILABLE:
+            # orjson emits UTF-8 bytes directly
+            option = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY |
+                      orjson.OPT_PASSTHROUGH_DATETIME)
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=option, default=str))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_file, report_file)
+    except BaseException:
+        # Don't leave a partial <report>.tmp behind
+        try:
+            os.unlink(tmp_file)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=1)
+def _get_evasion():
+    """Shared evasion system; it holds no per-document state, so build it once"""
+    return UltimatePlagiarismEvasion()
+
+
 class BatchWordProcessor:
     def __init__(self):
         if not DOCX_AVAILABLE:
             raise ImportError("python-docx is required. Install with: pip install python-docx")
         
-        self.evasion_system = UltimatePlagiarismEvasion()
+        self.evasion_system = _get_evasion()
         self.stats = {
             'total_documents': 0,
             'processed_documents': 0,
@@ -491,7 +680,7 @@ class BatchWordProcessor:
             'errors': []
         }
     
-    def backup_documents(self, input_folder, backup_folder=None):
+    def backup_documents(self, input_folder, backup_folder=None, docx_files=None):
         """Create backup of original documents before processing"""
         if not backup_folder:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -501,7 +690,8 @@ class BatchWordProcessor:
             if not os.path.exists(backup_folder):
                 os.makedirs(backup_folder)
             
-            docx_files = [f for f in os.listdir(input_folder) if f.endswith('.docx') and not f.startswith('~')]
+            if docx_files is None:
+                docx_files = list_docx_files(input_folder)
             
             for file in docx_files:
                 src = os.path.join(input_folder, file)
@@ -530,12 +720,21 @@ class BatchWordProcessor:
                 'total_paragraphs': 0,
                 'processed_paragraphs': 0,
                 'changes_made': 0,
-                'sections_processed': defaultdict(int)
+                'sections_processed': Counter()
             }
             
             current_section = 'UNKNOWN'
+            section_is_high = False
+            candidates = []
+            
+            # Aggressiveness adjusted by section priority (fixed for the whole document)
+            priority_aggressiveness = {
+                'HIGH': min(aggressiveness + 0.2, 0.9),
+                'MEDIUM': aggressiveness,
+                'LOW': max(aggressiveness - 0.2, 0.3),
+            }
             
-            # Process each paragraph
+            # Select paragraphs and their aggressiveness
             for i, paragraph in enumerate(doc.paragraphs):
                 para_text = paragraph.text.strip()
                 doc_stats['total_paragraphs'] += 1
@@ -546,6 +745,8 @@ class BatchWordProcessor:
                 # Detect section headers
                 if self.evasion_system.is_section_header(para_text):
                     current_section = para_text
+                    # Checked once per section: a HIGH header makes every paragraph under it HIGH
+                    section_is_high = self.evasion_system.get_section_priority(current_section) == 'HIGH'
                     print(f"  📍 Section: {current_section}")
                     continue
                 
@@ -553,20 +754,23 @@ class BatchWordProcessor:
                 if not self.evasion_system.is_paragraph_suitable_for_processing(para_text):
                     continue
                 
-                # Determine priority and aggressiveness
-                section_priority = self.evasion_system.get_section_priority(current_section + " " + para_text)
+                # Nothing to rewrite means 0% reduction: skip the full transform
+                if not self.evasion_system.has_transformable_content(para_text):
+                    print(f"    ⏭️ Para {i+1}: Skipped (no transformable content)")
+                    continue
                 
-                # Adjust aggressiveness based on priority
-                if section_priority == 'HIGH':
-                    para_aggressiveness = min(aggressiveness + 0.2, 0.9)
-                elif section_priority == 'MEDIUM':
-                    para_aggressiveness = aggressiveness
+                # Determine priority and aggressiveness
+                if section_is_high:
+                    section_priority = 'HIGH'
                 else:
-                    para_aggressiveness = max(aggressiveness - 0.2, 0.3)
-                
-                # Apply ultimate transformation
-                result = self.evasion_system.ultimate_transform(para_text, para_aggressiveness)
+                    section_priority = self.evasion_system.get_section_priority(current_section + " " + para_text)
                 
+                candidates.append((i, paragraph, para_text, section_priority, priority_aggressiveness[section_priority]))
+            
+            # Apply ultimate transformation (split across processes for very long documents)
+            results = self.transform_paragraphs([(c[2], c[4]) for c in candidates])
+            
+            for (i, paragraph, _, section_priority, _), result in zip(candidates, results):
                 # Only update if there's significant improvement
                 if result['similarity_reduction'] > 25:  # At least 25% reduction
                     # Clear paragraph and add transformed text
@@ -589,10 +793,7 @@ class BatchWordProcessor:
             doc.save(file_path)
             
             # Update global statistics
-            self.stats['processed_documents'] += 1
-            self.stats['total_paragraphs'] += doc_stats['total_paragraphs']
-            self.stats['processed_paragraphs'] += doc_stats['processed_paragraphs']
-            self.stats['total_changes'] += doc_stats['changes_made']
+            self.record_document_stats(doc_stats)
             
             print(f"  📊 Document Summary:")
             print(f"     • Total paragraphs: {doc_stats['total_paragraphs']}")
@@ -611,6 +812,37 @@ class BatchWordProcessor:
             self.stats['errors'].append(error_msg)
             return None
     
+    def record_document_stats(self, doc_stats):
+        """Add one document's statistics to the batch totals"""
+        self.stats['processed_documents'] += 1
+        self.stats['total_paragraphs'] += doc_stats['total_paragraphs']
+        self.stats['processed_paragraphs'] += doc_stats['processed_paragraphs']
+        self.stats['total_changes'] += doc_stats['changes_made']
+    
+    def transform_paragraphs(self, jobs):
+        """Yield ultimate_transform results for (text, aggressiveness) jobs, in order
+        
+        Results are streamed so each one can be applied and dropped instead of
+        holding every transformed paragraph of a long document at once.
+        """
+        workers = _worker_count(len(jobs) // PARAGRAPHS_PER_WORKER)
+        
+        # Every paragraph gets its own seed from the evasion RNG, so a seeded run
+        # transforms it the same way in-process or in any worker
+        rng = self.evasion_system._rng
+        jobs = [(text, aggr, rng.getrandbits(64)) for text, aggr in jobs]
+        
+        # Inside a batch worker, or for normal-sized documents, stay in-process
+        if _worker_processor is not None or workers < 2:
+            yield from _transform_group(jobs, self.evasion_system)
+            return
+        
+        size = -(-len(jobs) // workers)
+        groups = [jobs[k:k + size] for k in range(0, len(jobs), size)]
+        with ProcessPoolExecutor(max_workers=len(groups), mp_context=_pool_context()) as pool:
+            for group in pool.map(_transform_group, groups):
+                yield from group
+    
     def process_batch(self, input_folder, aggressiveness=0.6, create_backup=True):
         """Process all Word documents in a folder"""
         start_time = datetime.now()
@@ -625,8 +857,7 @@ class BatchWordProcessor:
             return
         
         # Get list of Word documents
-        docx_files = [f for f in os.listdir(input_folder) 
-                     if f.endswith('.docx') and not f.startswith('~')]
+        docx_files = list_docx_files(input_folder)
         
         if not docx_files:
             print(f"❌ No Word documents found in: {input_folder}")
@@ -641,23 +872,51 @@ class BatchWordProcessor:
         # Create backup if requested
         backup_folder = None
         if create_backup:
-            backup_folder = self.backup_documents(input_folder)
+            backup_folder = self.backup_documents(input_folder, docx_files=docx_files)
             if not backup_folder:
                 print("❌ Failed to create backup. Aborting for safety.")
                 return
         
         print(f"\n🚀 Starting batch processing...")
         
-        # Process each document
-        for i, filename in enumerate(docx_files, 1):
-            file_path = os.path.join(input_folder, filename)
-            
-            print(f"\n{'='*20} Document {i}/{len(docx_files)} {'='*20}")
-            
-            doc_result = self.process_word_document(file_path, aggressiveness=aggressiveness)
+        # One seed per document, drawn from the evasion RNG up front, so a seeded
+        # run gives the same documents whether it goes serial or parallel
+        rng = self.evasion_system._rng
+        seeds = [rng.getrandbits(64) for _ in docx_files]
+        
+        # Documents are independent, so spread them over worker processes
+        workers = _worker_count(len(docx_files))
+        
+        if workers > 1:
+            print(f"⚡ Using {workers} worker processes")
+            jobs = [(os.path.join(input_folder, filename), aggressiveness, seed)
+                    for filename, seed in zip(docx_files, seeds)]
             
-            if doc_result is None:
-                print(f"⚠️ Skipped {filename} due to errors")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context(),
+                                     initializer=_init_batch_worker) as pool:
+                # Workers return their log instead of printing, so each document's
+                # output comes out whole and in order, as on the serial path
+                for i, (filename, doc_result, errors, log) in enumerate(pool.map(_process_one_doc, jobs), 1):
+                    print(f"\n{'='*20} Document {i}/{len(docx_files)} {'='*20}")
+                    print(log, end='')
+                    
+                    self.stats['errors'].extend(errors)
+                    if doc_result is None:
+                        print(f"⚠️ Skipped {filename} due to errors")
+                    else:
+                        self.record_document_stats(doc_result)
+        else:
+            # Process each document
+            for i, (filename, seed) in enumerate(zip(docx_files, seeds), 1):
+                file_path = os.path.join(input_folder, filename)
+                
+                print(f"\n{'='*20} Document {i}/{len(docx_files)} {'='*20}")
+                
+                rng.seed(seed)
+                doc_result = self.process_word_document(file_path, aggressiveness=aggressiveness)
+                
+                if doc_result is None:
+                    print(f"⚠️ Skipped {filename} due to errors")
         
         # Calculate processing time
         end_time = datetime.now()
@@ -713,8 +972,7 @@ class BatchWordProcessor:
                 }
             }
             
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, ensure_ascii=False, indent=2)
+            write_json_report(report_file, report_data)
             
             print(f"📋 Processing report saved: {report_file}")
             
@@ -722,6 +980,73 @@ class BatchWordProcessor:
             print(f"⚠️ Could not save report: {e}")
 
 
+# Per-process BatchWordProcessor used by process_batch workers
+_worker_processor = None
+
+# A single document is split across processes only beyond this many paragraphs per worker.
+# ultimate_transform takes ~0.3 ms a paragraph, so each worker gets ~0.5 s of work:
+# well clear of the fork and result-pickling overhead
+PARAGRAPHS_PER_WORKER = 1500
+
+
+def _worker_count(n_tasks):
+    """Worker processes for n_tasks (PARAPHRASE_WORKERS overrides one per spare core)"""
+    workers = _workers_override(os.environ.get('PARAPHRASE_WORKERS', '')) or max((os.cpu_count() or 2) - 1, 1)
+    return min(workers, n_tasks)
+
+
+@lru_cache(maxsize=8)
+def _workers_override(value):
+    """Positive worker count from a PARAPHRASE_WORKERS value, else None (warns once per bad value)"""
+    if not value.strip():
+        return None
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        print(f"⚠️ Ignoring invalid PARAPHRASE_WORKERS={value!r}; using the default worker count")
+        return None
+    return workers
+
+
+def _pool_context():
+    """Prefer fork so workers inherit the evasion system (compiled tables, automaton)
+    copy-on-write; elsewhere each worker builds its own"""
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return None
+
+
+def _init_batch_worker():
+    """Set up the worker's processor (the evasion system is inherited when forked)"""
+    global _worker_processor
+    _worker_processor = BatchWordProcessor()
+
+
+def _process_one_doc(job):
+    """Process one document in a worker, returning (filename, doc_stats, errors, log)"""
+    file_path, aggressiveness, seed = job
+    # Per-document seed from the parent, as on the serial path
+    _worker_processor.evasion_system._rng.seed(seed)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        doc_stats = _worker_processor.process_word_document(file_path, aggressiveness=aggressiveness)
+    errors = _worker_processor.stats['errors']
+    _worker_processor.stats['errors'] = []
+    return os.path.basename(file_path), doc_stats, errors, log.getvalue()
+
+
+def _transform_group(group, evasion=None):
+    """ultimate_transform a contiguous group of (text, aggressiveness, seed) paragraphs"""
+    evasion = evasion or _get_evasion()
+    results = []
+    for text, aggr, seed in group:
+        evasion._rng.seed(seed)
+        results.append(evasion.ultimate_transform(text, aggr, record_changes=False))
+    return results
+
+
 def main():
     """Main function for batch Word document processing"""
     print("🎯 ULTIMATE PLAGIARISM EVASION - BATCH WORD PROCESSOR")
@@ -774,7 +1099,7 @@ def demo_single_text():
     print("\n🧪 DEMO - SINGLE TEXT TRANSFORMATION:")
     
     # Initialize system
-    evasion = UltimatePlagiarismEvasion()
+    evasion = _get_evasion()
     
     # Sample academic text
     sample_text = """Penelitian ini bertujuan untuk mengembangkan sistem informasi yang dapat 
@@ -815,7 +1140,7 @@ def check_requirements():
     
     # Check if documents folder exists
     if os.path.exists('documents'):
-        docx_files = [f for f in os.listdir('documents') if f.endswith('.docx')]
+        docx_files = list_docx_files('documents')
         print(f"✅ Documents folder found with {len(docx_files)} .docx files")
     else:
         print("⚠️ 'documents' folder not found")
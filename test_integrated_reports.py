@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test untuk penulisan laporan JSON di integrated_smart_paraphrase_system
+"""
+
+from datetime import datetime
+
+import pytest
+
+import integrated_smart_paraphrase_system as isps
+
+
+SAMPLE_REPORT = {
+    'statistics': {'processing_start_time': datetime(2024, 1, 1, 12, 0, 0), 1: 'non-str key'},
+    'paragraphs': [{'index': 1, 'text': 'Penelitian ini menggunakan metode kualitatif.'}],
+}
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_report_format_does_not_depend_on_orjson(tmp_path, monkeypatch, compact):
+    """orjson and the json fallback write the same report, datetimes included"""
+    pytest.importorskip('orjson')
+    outputs = []
+    for use_orjson in (True, False):
+        monkeypatch.setattr(isps, 'ORJSON_AVAILABLE', use_orjson)
+        report_file = tmp_path / f"report_{use_orjson}.json"
+        isps.write_json_report(str(report_file), SAMPLE_REPORT, compact)
+        outputs.append(report_file.read_text(encoding='utf-8'))
+
+    assert outputs[0] == outputs[1]
+    assert '2024-01-01 12:00:00' in outputs[0]
+
+
+def test_failed_write_leaves_no_tmp_file(tmp_path, monkeypatch):
+    """An encode error removes the partial .tmp file and leaves no report"""
+    monkeypatch.setattr(isps, 'ORJSON_AVAILABLE', False)
+    circular = {}
+    circular['self'] = circular
+    report_file = tmp_path / "report.json"
+
+    with pytest.raises(ValueError):
+        isps.write_json_report(str(report_file), circular)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.parametrize('compact', [True, False])
+def test_spliced_report_matches_direct_encode(tmp_path, compact):
+    """Splicing pre-encoded paraphrase results gives the same bytes as encoding the whole report"""
+    pytest.importorskip('orjson')
+    paraphrase_results = {
+        'filename': 'BAB I.docx',
+        'paragraphs_paraphrased': 2,
+        'paraphrase_details': [
+            {'paragraph_index': 3, 'paraphrased_text': 'Studi ini memanfaatkan metode kualitatif.'},
+            {'paragraph_index': 7, 'paraphrased_text': 'Temuan riset — “signifikan”.', 'nested': {'a': [1, 2]}},
+        ],
+        'summary': {},
+    }
+    report = {
+        'document_info': {'filename': 'BAB I.docx'},
+        'paraphrase_results': paraphrase_results,
+        'processing_statistics': {'processing_start_time': datetime(2024, 1, 1, 12, 0, 0)},
+        'next_steps': ['✅ Document has been automatically paraphrased'],
+    }
+
+    buf = isps.write_json_report(str(tmp_path / "paraphrase.json"), paraphrase_results, compact)
+    spliced = isps.write_json_report(str(tmp_path / "spliced.json"), report, compact,
+                                     {'paraphrase_results': buf})
+    direct = isps.write_json_report(str(tmp_path / "direct.json"), report, compact)
+
+    assert spliced == direct
+    assert (tmp_path / "spliced.json").read_bytes() == (tmp_path / "direct.json").read_bytes()
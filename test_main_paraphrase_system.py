@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test untuk jalur paralel batch_paraphrase di main_paraphrase_system.py
+"""
+
+import multiprocessing
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import main_paraphrase_system as mps
+
+
+TEXTS = [
+    "Penelitian ini menggunakan metode kualitatif untuk menganalisis data yang diperoleh dari hasil wawancara.",
+    "Hasil penelitian menunjukkan bahwa sistem yang dikembangkan dapat meningkatkan efisiensi proses administrasi.",
+    "Berdasarkan analisis tersebut dapat disimpulkan bahwa pendekatan yang digunakan sangat efektif.",
+    "Tujuan penelitian ini adalah untuk mengetahui pengaruh penggunaan teknologi informasi terhadap kinerja pegawai.",
+]
+
+
+@pytest.fixture(scope='module')
+def system():
+    return mps.IndonesianParaphraseSystem('sinonim.json')
+
+
+class RecordingPool(ProcessPoolExecutor):
+    """ProcessPoolExecutor that remembers its worker count"""
+    started = []
+
+    def __init__(self, max_workers=None, **kwargs):
+        RecordingPool.started.append(max_workers)
+        super().__init__(max_workers=max_workers, **kwargs)
+
+
+def _batch(system, texts):
+    random.seed(2024)
+    return system.batch_paraphrase(texts, aggressiveness=0.8)
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+def test_pooled_batch_matches_serial(system, monkeypatch):
+    """The worker pool returns the serial results, in order, and releases _worker_system"""
+    texts = [f"{TEXTS[n % len(TEXTS)]} Bagian {n}." for n in range(12)]
+    serial = _batch(system, texts)
+
+    RecordingPool.started.clear()
+    monkeypatch.setattr(mps, 'ProcessPoolExecutor', RecordingPool)
+    monkeypatch.setattr(mps, 'PARALLEL_MIN_TEXTS', 1)
+    monkeypatch.setattr(mps.os, 'cpu_count', lambda: 3)
+    pooled = _batch(system, texts)
+
+    assert RecordingPool.started == [2]
+    assert mps._worker_system is None
+    assert pooled == serial
+    assert [r['batch_number'] for r in pooled] == list(range(1, len(texts) + 1))
+    assert [r['original_length'] for r in pooled] == [len(text.split()) for text in texts]
+    assert any(r['paraphrase'] != text for r, text in zip(pooled, texts))
+
+
+def test_seeded_batch_is_repeatable(system):
+    """Re-seeding the caller's random reproduces the batch"""
+    assert _batch(system, TEXTS) == _batch(system, TEXTS)
@@ -569,22 +569,24 @@ class UltimateHybridParaphraser:
         """Create cache key for AI results"""
         return hashlib.md5(text.encode('utf-8')).hexdigest()[:16]
     
-    def should_use_ai_smart(self, paragraph_text, local_result):
+    def should_use_ai_smart(self, paragraph_text, local_result, config=None):
         """Smart routing decision: Local or AI? (from smart_hybrid_paraphraser.py)"""
+        config = config or self.current_config
+        
         # Always try local first - if it's good enough, don't use AI
-        if local_result['plagiarism_reduction'] >= self.current_config['local_confidence_threshold'] * 100:
+        if local_result['plagiarism_reduction'] >= config['local_confidence_threshold'] * 100:
             return False, "Local result sufficient"
         
         # Check paragraph length
         word_count = len(paragraph_text.split())
-        if word_count < self.current_config['min_paragraph_length']:
+        if word_count < config['min_paragraph_length']:
             return False, "Paragraph too short"
         
         # Calculate complexity
         complexity = self.calculate_paragraph_complexity(paragraph_text)
         
         # High complexity → Use AI
-        if complexity >= self.current_config['complexity_threshold']:
+        if complexity >= config['complexity_threshold']:
             return True, f"High complexity ({complexity:.2f})"
         
         # Check for academic patterns that benefit from AI
@@ -593,14 +595,15 @@ class UltimateHybridParaphraser:
             return True, f"Multiple academic patterns ({pattern_matches})"
         
         # High plagiarism risk based on local analysis
-        if local_result['similarity'] >= self.current_config['plagiarism_risk_threshold'] * 100:
+        if local_result['similarity'] >= config['plagiarism_risk_threshold'] * 100:
             return True, f"High plagiarism risk ({local_result['similarity']:.1f}%)"
         
         return False, "Local processing adequate"
     
-    def should_use_ai_balanced(self, paragraph_text, local_result, paragraph_index, total_paragraphs):
+    def should_use_ai_balanced(self, paragraph_text, local_result, paragraph_index, total_paragraphs, config=None):
         """Balanced routing: aim for target AI usage (from balanced_hybrid_paraphraser.py)"""
-        target_ai_ratio = self.current_config['ai_usage_target']
+        config = config or self.current_config
+        target_ai_ratio = config['ai_usage_target']
         
         # Force some paragraphs to use AI for comparison
         ai_probability = target_ai_ratio  # Base probability
@@ -627,15 +630,15 @@ class UltimateHybridParaphraser:
             return True, f"Balanced selection (prob: {ai_probability:.2f})"
         
         # Traditional criteria (lowered thresholds)
-        if local_result['plagiarism_reduction'] < self.current_config['local_confidence_threshold'] * 100:
+        if local_result['plagiarism_reduction'] < config['local_confidence_threshold'] * 100:
             return True, f"Low local performance ({local_result['plagiarism_reduction']:.1f}%)"
         
         # Check paragraph length (lowered threshold)
-        if word_count < self.current_config['min_paragraph_length']:
+        if word_count < config['min_paragraph_length']:
             return False, "Paragraph too short"
         
         # Complexity check (lowered threshold)
-        if complexity >= self.current_config['complexity_threshold']:
+        if complexity >= config['complexity_threshold']:
             return True, f"Moderate complexity ({complexity:.2f})"
         
         # Academic patterns (more generous)
@@ -644,20 +647,22 @@ class UltimateHybridParaphraser:
         
         return False, "Local processing preferred"
     
-    def should_use_ai_turnitin_safe(self, paragraph_text, local_result):
+    def should_use_ai_turnitin_safe(self, paragraph_text, local_result, config=None):
         """Turnitin-safe routing: extra careful approach"""
+        config = config or self.current_config
+        
         # Check for Turnitin risk patterns
         risk_patterns = sum(1 for pattern in self.turnitin_risk_patterns if re.search(pattern, paragraph_text.lower()))
         if risk_patterns >= 2:
             return True, f"High Turnitin risk patterns ({risk_patterns})"
         
         # Higher thresholds for turnitin_safe mode
-        if local_result['plagiarism_reduction'] < self.current_config['local_confidence_threshold'] * 100:
+        if local_result['plagiarism_reduction'] < config['local_confidence_threshold'] * 100:
             return True, f"Insufficient local reduction ({local_result['plagiarism_reduction']:.1f}%)"
         
         # More complex texts need AI
         complexity = self.calculate_paragraph_complexity(paragraph_text)
-        if complexity >= self.current_config['complexity_threshold']:
+        if complexity >= config['complexity_threshold']:
             return True, f"High complexity for Turnitin ({complexity:.2f})"
         
         # Conservative approach for academic content
@@ -666,38 +671,42 @@ class UltimateHybridParaphraser:
         
         return False, "Turnitin-safe: Local adequate"
     
-    def decide_ai_usage(self, paragraph_text, local_result, paragraph_index=0, total_paragraphs=1):
-        """Central AI decision logic based on current mode"""
-        if self.mode == 'smart':
-            return self.should_use_ai_smart(paragraph_text, local_result)
-        elif self.mode == 'balanced':
-            return self.should_use_ai_balanced(paragraph_text, local_result, paragraph_index, total_paragraphs)
-        elif self.mode == 'aggressive':
+    def decide_ai_usage(self, paragraph_text, local_result, paragraph_index=0, total_paragraphs=1, mode=None):
+        """Central AI decision logic based on the given mode (defaults to current mode)"""
+        mode = mode or self.mode
+        config = self.configs.get(mode, self.current_config)
+        
+        if mode == 'smart':
+            return self.should_use_ai_smart(paragraph_text, local_result, config)
+        elif mode == 'balanced':
+            return self.should_use_ai_balanced(paragraph_text, local_result, paragraph_index, total_paragraphs, config)
+        elif mode == 'aggressive':
             # Always use AI unless very short
             word_count = len(paragraph_text.split())
-            if word_count >= self.current_config['min_paragraph_length']:
+            if word_count >= config['min_paragraph_length']:
                 return True, "Aggressive mode: Always AI"
             return False, "Too short for aggressive mode"
-        elif self.mode == 'turnitin_safe':
-            return self.should_use_ai_turnitin_safe(paragraph_text, local_result)
+        elif mode == 'turnitin_safe':
+            return self.should_use_ai_turnitin_safe(paragraph_text, local_result, config)
         else:
             # Fallback to smart
-            return self.should_use_ai_smart(paragraph_text, local_result)
+            return self.should_use_ai_smart(paragraph_text, local_result, config)
     
-    def call_gemini_api(self, paragraphs_batch):
+    def call_gemini_api(self, paragraphs_batch, mode=None):
         """Call Gemini API for batch processing with multiple methods"""
+        mode = mode or self.mode
         if self.api_method == 'genai' and self.gemini_client:
-            return self._call_gemini_genai(paragraphs_batch)
+            return self._call_gemini_genai(paragraphs_batch, mode)
         elif self.api_method == 'requests':
-            return self._call_gemini_requests(paragraphs_batch)
+            return self._call_gemini_requests(paragraphs_batch, mode)
         else:
             print("❌ No Gemini API method available")
             return None
     
-    def _call_gemini_genai(self, paragraphs_batch):
+    def _call_gemini_genai(self, paragraphs_batch, mode=None):
         """Call Gemini using google-generativeai package"""
         try:
-            prompt = self.create_gemini_prompt(paragraphs_batch)
+            prompt = self.create_gemini_prompt(paragraphs_batch, mode)
             
             generation_config = genai.GenerationConfig(
                 temperature=0.4,
@@ -720,7 +729,7 @@ class UltimateHybridParaphraser:
                         self.cost_tracker['ai_tokens_used'] += tokens_used
                         self.cost_tracker['estimated_cost_usd'] += tokens_used * 0.000001
                         
-                        return self.parse_gemini_response(response.text, paragraphs_batch)
+                        return self.parse_gemini_response(response.text, paragraphs_batch, mode)
                     
                 except Exception as e:
                     print(f"⚠️  Gemini GenAI attempt {attempt + 1} failed: {e}")
@@ -733,10 +742,10 @@ class UltimateHybridParaphraser:
             print(f"❌ Gemini GenAI error: {e}")
             return None
     
-    def _call_gemini_requests(self, paragraphs_batch):
+    def _call_gemini_requests(self, paragraphs_batch, mode=None):
         """Call Gemini using requests (fallback method)"""
         try:
-            prompt = self.create_gemini_prompt(paragraphs_batch)
+            prompt = self.create_gemini_prompt(paragraphs_batch, mode)
             
             headers = {
                 'Content-Type': 'application/json',
@@ -776,7 +785,7 @@ class UltimateHybridParaphraser:
                             self.cost_tracker['ai_tokens_used'] += tokens_used
                             self.cost_tracker['estimated_cost_usd'] += tokens_used * 0.000002
                             
-                            return self.parse_gemini_response(ai_response, paragraphs_batch)
+                            return self.parse_gemini_response(ai_response, paragraphs_batch, mode)
                     
                     else:
                         print(f"⚠️  Gemini API error {response.status_code}: {response.text}")
@@ -792,8 +801,9 @@ class UltimateHybridParaphraser:
             print(f"❌ Gemini API error: {e}")
             return None
     
-    def create_gemini_prompt(self, paragraphs_batch):
+    def create_gemini_prompt(self, paragraphs_batch, mode=None):
         """Create optimized prompt for Gemini API"""
+        mode = mode or self.mode
         mode_instructions = {
             'smart': 'Fokus pada efisiensi biaya dengan hasil berkualitas tinggi.',
             'balanced': 'Berikan hasil terbaik untuk perbandingan dengan metode lokal.',
@@ -803,7 +813,7 @@ class UltimateHybridParaphraser:
         
         prompt = f"""Kamu adalah expert paraphrasing untuk teks akademik bahasa Indonesia. 
 
-MODE: {self.mode.upper()} - {mode_instructions.get(self.mode, '')}
+MODE: {mode.upper()} - {mode_instructions.get(mode, '')}
 
 MISI: Parafrase paragraf berikut untuk mengurangi plagiarisme secara signifikan sambil mempertahankan makna akademik yang tepat.
 
@@ -831,8 +841,9 @@ PARAGRAF YANG PERLU DIPARAFRASE:
         
         return prompt
     
-    def parse_gemini_response(self, ai_response, original_paragraphs):
+    def parse_gemini_response(self, ai_response, original_paragraphs, mode=None):
         """Parse Gemini response back to structured format"""
+        mode = mode or self.mode
         results = []
         
         try:
@@ -860,7 +871,7 @@ PARAGRAF YANG PERLU DIPARAFRASE:
                             'similarity': round(similarity, 2),
                             'plagiarism_reduction': round(100 - similarity, 2),
                             'changes_made': 1,
-                            'method': f'gemini_{self.mode}',
+                            'method': f'gemini_{mode}',
                             'status': self._get_plagiarism_status(similarity),
                             'original_length': len(original_text.split()),
                             'paraphrase_length': len(paraphrased_text.split())
@@ -876,18 +887,23 @@ PARAGRAF YANG PERLU DIPARAFRASE:
     
     # ===== MAIN PROCESSING ENGINE =====
     
-    def process_paragraph_ultimate(self, paragraph_text, paragraph_index=0, total_paragraphs=1, aggressiveness=0.5):
-        """Ultimate paragraph processing with mode-aware routing and comparison"""
+    def process_paragraph_ultimate(self, paragraph_text, paragraph_index=0, total_paragraphs=1, aggressiveness=0.5, mode=None):
+        """Ultimate paragraph processing with mode-aware routing and comparison
+        
+        `mode` overrides the instance mode for this call only, without touching shared state.
+        """
+        mode = mode or self.mode
+        config = self.configs.get(mode, self.current_config)
         
         # Step 1: Always get local result first
         local_result = self.generate_local_paraphrase(paragraph_text, aggressiveness)
         self.cost_tracker['local_calls'] += 1
         
         # Step 2: Decide if AI is needed based on current mode
-        use_ai, reason = self.decide_ai_usage(paragraph_text, local_result, paragraph_index, total_paragraphs)
+        use_ai, reason = self.decide_ai_usage(paragraph_text, local_result, paragraph_index, total_paragraphs, mode)
         
         if not use_ai:
-            local_result['method'] = f'local_{self.mode}'
+            local_result['method'] = f'local_{mode}'
             local_result['routing_reason'] = reason
             return local_result
         
@@ -896,19 +912,19 @@ PARAGRAF YANG PERLU DIPARAFRASE:
         if cache_key in self.ai_cache:
             self.cost_tracker['cache_hits'] += 1
             ai_result = self.ai_cache[cache_key].copy()
-            ai_result['method'] = f'ai_cached_{self.mode}'
+            ai_result['method'] = f'ai_cached_{mode}'
             ai_result['routing_reason'] = reason
             
             # For balanced mode, still compare with local
-            if self.mode == 'balanced' and self.current_config.get('comparison_mode', False):
+            if mode == 'balanced' and config.get('comparison_mode', False):
                 self._log_comparison(local_result, ai_result, paragraph_index)
             
             return ai_result
         
         # Step 4: Use AI
-        print(f"    🤖 Using AI ({self.mode}): {reason}")
+        print(f"    🤖 Using AI ({mode}): {reason}")
         
-        ai_results = self.call_gemini_api([{'text': paragraph_text}])
+        ai_results = self.call_gemini_api([{'text': paragraph_text}], mode)
         
         if ai_results and len(ai_results) > 0:
             ai_result = ai_results[0]
@@ -918,64 +934,65 @@ PARAGRAF YANG PERLU DIPARAFRASE:
             self.ai_cache[cache_key] = ai_result.copy()
             
             # Mode-specific result selection
-            final_result = self._select_best_result(local_result, ai_result, paragraph_index)
+            final_result = self._select_best_result(local_result, ai_result, paragraph_index, mode)
             return final_result
         
         # Step 5: Fallback to local if AI fails
-        local_result['method'] = f'local_fallback_{self.mode}'
+        local_result['method'] = f'local_fallback_{mode}'
         local_result['routing_reason'] = f"{reason} (AI failed)"
         return local_result
     
-    def _select_best_result(self, local_result, ai_result, paragraph_index):
-        """Select the best result based on current mode"""
+    def _select_best_result(self, local_result, ai_result, paragraph_index, mode=None):
+        """Select the best result based on the given mode (defaults to current mode)"""
+        mode = mode or self.mode
         
-        if self.mode == 'aggressive':
+        if mode == 'aggressive':
             # Always prefer AI in aggressive mode
-            ai_result['method'] = f'ai_{self.mode}'
+            ai_result['method'] = f'ai_{mode}'
             return ai_result
         
-        elif self.mode == 'balanced':
+        elif mode == 'balanced':
             # Compare results and log
             comparison = self._log_comparison(local_result, ai_result, paragraph_index)
             
             # Choose better result
             if ai_result['plagiarism_reduction'] > local_result['plagiarism_reduction']:
-                ai_result['method'] = f'ai_{self.mode}_winner'
+                ai_result['method'] = f'ai_{mode}_winner'
                 ai_result['improvement'] = ai_result['plagiarism_reduction'] - local_result['plagiarism_reduction']
                 return ai_result
             else:
-                local_result['method'] = f'local_{self.mode}_winner'
+                local_result['method'] = f'local_{mode}_winner'
                 local_result['improvement'] = local_result['plagiarism_reduction'] - ai_result['plagiarism_reduction']
                 return local_result
         
-        elif self.mode == 'smart':
+        elif mode == 'smart':
             # Smart selection: prefer AI only if significantly better
             improvement_threshold = 10  # AI must be 10% better
             if ai_result['plagiarism_reduction'] > local_result['plagiarism_reduction'] + improvement_threshold:
-                ai_result['method'] = f'ai_{self.mode}_better'
+                ai_result['method'] = f'ai_{mode}_better'
                 ai_result['improvement'] = ai_result['plagiarism_reduction'] - local_result['plagiarism_reduction']
                 return ai_result
             else:
-                local_result['method'] = f'local_{self.mode}_sufficient'
+                local_result['method'] = f'local_{mode}_sufficient'
                 local_result['ai_attempted'] = True
                 return local_result
         
-        elif self.mode == 'turnitin_safe':
+        elif mode == 'turnitin_safe':
             # Turnitin-safe: prefer the result with lower similarity (higher reduction)
             if ai_result['similarity'] < local_result['similarity']:
-                ai_result['method'] = f'ai_{self.mode}_safer'
+                ai_result['method'] = f'ai_{mode}_safer'
                 return ai_result
             else:
-                local_result['method'] = f'local_{self.mode}_safer'
+                local_result['method'] = f'local_{mode}_safer'
                 return local_result
         
         else:
             # Default: choose better result
             if ai_result['plagiarism_reduction'] > local_result['plagiarism_reduction']:
-                ai_result['method'] = f'ai_{self.mode}_default'
+                ai_result['method'] = f'ai_{mode}_default'
                 return ai_result
             else:
-                local_result['method'] = f'local_{self.mode}_default'
+                local_result['method'] = f'local_{mode}_default'
                 return local_result
     
     def _log_comparison(self, local_result, ai_result, paragraph_index):